@@ -237,7 +237,7 @@ class Extractor:
     # Helper methods
     # ----------------------------------------------------------------------
     @staticmethod
-    def __get_item_data(fields: list, cmd_tbl: dict, cur_item) -> dict:
+    def __get_item_data(bound_fields: tuple, cur_item) -> dict:
         """
         Getter engine used to aggregate desired data from a given API item.
 
@@ -247,10 +247,8 @@ class Extractor:
         {field name: field data}, e.g. {"issue number": 20}.
 
         Args:
-            user_cfg (conf.Cfg): Cfg object containing user-provided
-                configuration
-            item_type (str): name of item type to retrieve, e.g.
-                "pr" or "issue"
+            bound_fields (tuple): (field name, getter) pairs, as
+                returned by schema.bind_fields.
             cur_item (github.Issue/PullRequest/Commit): the current
                 API item to get data about, e.g. current PR
 
@@ -258,8 +256,8 @@ class Extractor:
             dict: dictionary of API data values for param item
         """
         # when called, this will resolve to various function calls, e.g.
-        # "body": cmd_tbl["body"](cur_PR)
-        return {field: cmd_tbl[field](cur_item) for field in fields}
+        # "body": _get_body(cur_PR)
+        return {field: getter(cur_item) for field, getter in bound_fields}
 
     def __sleep_extractor(self) -> None:
         """
@@ -332,7 +330,15 @@ class Extractor:
             "issues": self.__get_item_data,
             "commits": self.__get_issue_commits,
             "comments": self.__get_issue_comments,
-        }.items()
+        }
+
+        # resolve the chosen fields of each item type to their getters
+        # once, instead of once per issue
+        bound_func_schema: list[tuple] = [
+            (func, schema.bind_fields(key, self.cfg.get_cfg_val(key)))
+            for key, func in func_schema.items()
+            if self.cfg.get_cfg_val(key)
+        ]
 
         out_data: dict = {}
         output_file: str = self.cfg.get_cfg_val("output_path")
@@ -352,15 +358,8 @@ class Extractor:
             cur_issue_data: dict = {}
 
             try:
-                for key, func in func_schema:
-                    if self.cfg.get_cfg_val(key):
-                        cur_issue_data |= func(
-                            self.cfg.get_cfg_val(key),
-                            schema.cmd_tbl[key],
-                            cur_issue,
-                        )
-
-                cur_issue_entry: dict = {str(cur_issue.number): cur_issue_data}
+                for func, bound_fields in bound_func_schema:
+                    cur_issue_data |= func(bound_fields, cur_issue)
 
             except github.RateLimitExceededException:
                 utils.write_merged_dict_to_jsonfile(out_data, output_file)
@@ -387,7 +386,7 @@ class Extractor:
                 sys.exit(1)
 
             else:
-                out_data |= cur_issue_entry
+                out_data[str(cur_issue.number)] = cur_issue_data
 
                 print(f"{CLR}{TAB * 2}Issue: {cur_issue.number}, ", end="")
                 print(f"calls: {self.gh_sesh.get_remaining_calls()}", end="\r")
@@ -396,14 +395,14 @@ class Extractor:
 
         print()
 
-    def __get_issue_comments(self, fields: list, cmd_tbl: dict, issue) -> dict:
+    def __get_issue_comments(self, bound_fields: tuple, issue) -> dict:
         """
         Get issue comment data for the given issue.
 
         Args:
+            bound_fields (tuple): (comment field, getter) pairs to
+                gather from each comment.
             issue (github.issue): issue to gather data about.
-            fields (list): a list of commit fields to gather from the issue.
-            cmd_tbl (dict): dict of {field: function to get field}
 
         Returns:
             dict: dictionary of {comment index: comment data}
@@ -413,28 +412,23 @@ class Extractor:
 
         # dict will hold data related to all comments for an
         # issue. Issue to comments is a one to many relationship
-        comment_index: int = 0
         cur_comment_data: dict = {}
 
-        for comment in issue.get_comments():
-            cur_entry = self.__get_item_data(fields, cmd_tbl, comment)
-
-            cur_entry = {str(comment_index): cur_entry}
-
-            cur_comment_data |= cur_entry
-
-            comment_index += 1
+        for comment_index, comment in enumerate(issue.get_comments()):
+            cur_comment_data[str(comment_index)] = self.__get_item_data(
+                bound_fields, comment
+            )
 
         return {field_type: cur_comment_data}
 
-    def __get_issue_commits(self, fields: list, cmd_tbl: dict, issue) -> dict:
+    def __get_issue_commits(self, bound_fields: tuple, issue) -> dict:
         """
         Get issue commit data for the given issue.
 
         Args:
+            bound_fields (tuple): (commit field, getter) pairs to
+                gather from each commit.
             issue (github.issue): issue to gather data about.
-            fields (list): a list of commit fields to gather from the issue.
-            cmd_tbl (dict): dict of {field: function to get field}
 
         Returns:
             dict: dictionary of {commit index: commit data}
@@ -464,21 +458,16 @@ class Extractor:
 
             """
             field_type: str = "commits"
-            commit_index: int = 0
             pr_commit_data: dict = {}
 
-            for commit in pr_obj.get_commits():
+            for commit_index, commit in enumerate(pr_obj.get_commits()):
                 if commit.files:
-                    commit_datum = self.__get_item_data(
-                        fields, cmd_tbl, commit
-                    )
+                    commit_datum = self.__get_item_data(bound_fields, commit)
 
                 else:
                     commit_datum = {}
 
-                pr_commit_data |= {str(commit_index): commit_datum}
-
-                commit_index += 1
+                pr_commit_data[str(commit_index)] = commit_datum
 
             return {field_type: pr_commit_data}
 
@@ -34,6 +34,8 @@ Resources:
         https://betterprogramming.pub/dispatch-tables-in-python-d37bcc443b0b
 """
 
+from collections.abc import Callable
+
 # 0000-00-00T00:00:00Z
 TIME_FMT = "%Y-%m-%dT%H:%M:%SZ"
 
@@ -190,6 +192,29 @@ cmd_tbl: dict = {
 }
 
 
+def bind_fields(
+    item_type: str, fields: list[str]
+) -> tuple[tuple[str, Callable], ...]:
+    """
+    Resolve field names to their getters in the command dispatch table.
+
+    Doing this once per extraction, rather than looking each field up
+    in cmd_tbl for every API item, lets callers iterate over
+    (field name, getter) pairs directly.
+
+    Args:
+        item_type (str): name of item type, e.g. "issues" or "commits".
+        fields (list[str]): field names chosen in configuration.
+
+    Returns:
+        tuple[tuple[str, Callable], ...]: (field name, getter) pairs,
+            in the order given.
+    """
+    item_cmd_tbl: dict = cmd_tbl[item_type]
+
+    return tuple((field, item_cmd_tbl[field]) for field in fields)
+
+
 _str_type = {"type": "string"}
 
 
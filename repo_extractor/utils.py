@@ -7,20 +7,44 @@ Includes:
 
 json docs:
     https://docs.python.org/3/library/json.html
+
+orjson docs:
+    https://github.com/ijl/orjson
+
+orjson is an optional extra; enable it with `poetry install -E orjson`.
+If it is installed, it is used to parse and serialize JSON files.
+Otherwise, the standard library json module is used. Anything orjson
+mishandles, such as invalid UTF-8 or integers wider than 64 bits, is
+handed to json instead, so both paths accept and reject the same files.
+The one remaining difference is that orjson writes NaN/Infinity as null.
 """
 
+from collections import deque
 import json
 from json.decoder import JSONDecodeError
+import mmap
 import os
+import re
 import sys
 
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+# orjson silently parses integers outside of the 64-bit range as floats.
+# Every such integer has at least 19 digits, so files containing a run of
+# 19 or more digits are parsed with json instead.
+_LONG_DIGITS_RE = re.compile(rb"[0-9]{19,}")
+
 
 def write_merged_dict_to_jsonfile(out_dict: dict, out_path: str) -> None:
     """
-    Recursively merge dictionaries and write them to an output JSON file.
+    Deep merge dictionaries and write them to an output JSON file.
 
     Get the desired output path, open and read any JSON data that may
-    already be there, and recursively merge in param data from the
+    already be there, and deep merge in param data from the
     most recent round of API calls.
 
     Args:
@@ -32,8 +56,8 @@ def write_merged_dict_to_jsonfile(out_dict: dict, out_path: str) -> None:
     # empty dict if no valid json is found
     json_dict = read_jsonfile_into_dict(out_path)
 
-    # recursively merge all dicts and nested dicts in both dictionaries
-    _merge_dicts_recursive(json_dict, out_dict)
+    # merge all dicts and nested dicts in both dictionaries
+    _merge_dicts(json_dict, out_dict)
 
     # write JSON content back to file
     _write_dict_to_jsonfile(json_dict, out_path)
@@ -50,49 +74,94 @@ def read_jsonfile_into_dict(in_path: str) -> dict:
         dict: dictionary constructed from JSON contents.
     """
     try:
-        with open(in_path, "r", encoding="UTF-8") as file_obj:
-            json_text = file_obj.read()
+        with open(in_path, "rb") as file_obj:
+            json_dict = _load_json_fileobj(file_obj)
 
-    except FileNotFoundError:
-        json_text = ""
-
-    try:
-        json_dict = json.loads(json_text)
-
-    except JSONDecodeError:
+    except (FileNotFoundError, JSONDecodeError):
         json_dict = {}
 
     return json_dict
 
 
-def _merge_dicts_recursive(base_dict: dict, add_dict: dict) -> None:
+def _load_json_fileobj(file_obj) -> dict:
+    """
+    Parse JSON out of an open binary file object.
+
+    Notes:
+        With the orjson extra installed, the file is memory-mapped and
+        parsed in place, avoiding an intermediate copy of the whole
+        file. Otherwise, the file is read and parsed with json.
+
+        Contents that orjson would mishandle are parsed with json so
+        that the result, or the error raised, matches the stdlib path.
+        orjson reports invalid UTF-8 as a JSONDecodeError where json
+        raises UnicodeDecodeError, and turns integers wider than 64 bits
+        into floats. Either would make write_merged_dict_to_jsonfile
+        overwrite existing output.
+
+    Args:
+        file_obj (BufferedReader): file opened in "rb" mode.
+
+    Raises:
+        JSONDecodeError: file contents are not valid JSON.
+        UnicodeDecodeError: file contents are not valid UTF-8.
+
+    Returns:
+        dict: dictionary constructed from JSON contents.
+    """
+    # empty files cannot be mapped; let json reject them as invalid
+    if orjson is None or os.fstat(file_obj.fileno()).st_size == 0:
+        return json.loads(file_obj.read())
+
+    with mmap.mmap(
+        file_obj.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped, memoryview(mapped) as mapped_view:
+        if _LONG_DIGITS_RE.search(mapped_view) is None:
+            try:
+                return orjson.loads(mapped_view)
+
+            except orjson.JSONDecodeError:
+                pass
+
+        return json.loads(mapped_view.tobytes())
+
+
+def _merge_dicts(base_dict: dict, add_dict: dict) -> None:
     """
-    Recursively merge two dictionaries.
+    Deep merge two dictionaries.
 
     Notes:
-        Credit to Paul Durivage
+        Based on the recursive merge by Paul Durivage
             https://gist.github.com/angstwad/bf22d1822c38a92ec0a9
+        but walks nested dicts with an explicit stack instead of
+        recursing, so deeply nested data cannot hit the recursion limit.
 
     Args:
         base_dict (dict): dict to be merged into
         add_dict (dict): dict of data to be merged
     """
-    # for each key in the dict that we created with the round of API calls
-    for key in add_dict:
+    # pairs of (dict to merge into, dict of data to merge) left to visit
+    dict_stack: deque[tuple[dict, dict]] = deque([(base_dict, add_dict)])
 
-        # if that key is in the dict in the existing JSON file and the val at
-        # the key is a dict in both dictionaries
-        if (
-            key in base_dict
-            and isinstance(base_dict[key], dict)
-            and isinstance(add_dict[key], dict)
-        ):
-            _merge_dicts_recursive(base_dict[key], add_dict[key])
+    while dict_stack:
+        cur_base, cur_add = dict_stack.pop()
 
-        else:
-            # assign the new value from the last round of calls to the existing
-            # key
-            base_dict[key] = add_dict[key]
+        # for each key in the dict that we created with the round of API calls
+        for key, val in cur_add.items():
+
+            # if that key is in the dict in the existing JSON file and the val
+            # at the key is a dict in both dictionaries
+            if (
+                key in cur_base
+                and isinstance(cur_base[key], dict)
+                and isinstance(val, dict)
+            ):
+                dict_stack.append((cur_base[key], val))
+
+            else:
+                # assign the new value from the last round of calls to the
+                # existing key
+                cur_base[key] = val
 
 
 def _write_dict_to_jsonfile(out_dict: dict, out_path: str) -> None:
@@ -108,15 +177,44 @@ def _write_dict_to_jsonfile(out_dict: dict, out_path: str) -> None:
     """
     mk_json_outpath(out_path)
 
+    json_bytes = _dump_json_bytes(out_dict)
+
     try:
-        with open(out_path, "w", encoding="UTF-8") as json_outfile:
-            json.dump(out_dict, json_outfile, ensure_ascii=False, indent=2)
+        with open(out_path, "wb") as json_outfile:
+            json_outfile.write(json_bytes)
 
     except FileNotFoundError:
         print(f"\nFile at {out_path} not found!")
         sys.exit(1)
 
 
+def _dump_json_bytes(out_dict: dict) -> bytes:
+    """
+    Serialize a Python dictionary to pretty-printed UTF-8 JSON.
+
+    Notes:
+        With the orjson extra installed, orjson is tried first. If it
+        refuses the data, e.g. an integer wider than 64 bits, json is
+        used instead so that the output can still be written.
+
+    Args:
+        out_dict (dict): dictionary to serialize.
+
+    Returns:
+        bytes: JSON text, indented by 2 spaces.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                out_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+
+        except orjson.JSONEncodeError:
+            pass
+
+    return json.dumps(out_dict, ensure_ascii=False, indent=2).encode("UTF-8")
+
+
 def mk_json_outpath(out_path: str):
     """
     Create path to JSON file to write output data to.
@@ -176,4 +274,4 @@ def read_file_line(in_path: str) -> str:
         sys.exit(1)
 
     else:
-        return file_text.strip().strip("\n")
+        return file_text.strip()